@@ -0,0 +1,138 @@
+"""
+Statx Module
+
+This module provides a minimal lstat() replacement built on the Linux statx(2)
+system call. It asks only for the fields the folder walk uses, and passes
+AT_STATX_DONT_SYNC so network filesystems may answer from cached attributes
+instead of synchronising with the server.
+"""
+
+import ctypes
+import errno
+import os
+import sys
+from typing import NamedTuple
+
+AT_FDCWD = -100
+AT_SYMLINK_NOFOLLOW = 0x100
+AT_STATX_DONT_SYNC = 0x4000
+
+STATX_TYPE = 0x0001
+STATX_NLINK = 0x0004
+STATX_INO = 0x0100
+STATX_SIZE = 0x0200
+
+
+class StatxResult(NamedTuple):
+    """Subset of stat fields returned by statx_size, named like os.stat_result."""
+    st_mode: int
+    st_size: int
+    st_nlink: int
+    st_dev: int
+    st_ino: int
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ('tv_sec', ctypes.c_int64),
+        ('tv_nsec', ctypes.c_uint32),
+        ('__reserved', ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    _fields_ = [
+        ('stx_mask', ctypes.c_uint32),
+        ('stx_blksize', ctypes.c_uint32),
+        ('stx_attributes', ctypes.c_uint64),
+        ('stx_nlink', ctypes.c_uint32),
+        ('stx_uid', ctypes.c_uint32),
+        ('stx_gid', ctypes.c_uint32),
+        ('stx_mode', ctypes.c_uint16),
+        ('__spare0', ctypes.c_uint16),
+        ('stx_ino', ctypes.c_uint64),
+        ('stx_size', ctypes.c_uint64),
+        ('stx_blocks', ctypes.c_uint64),
+        ('stx_attributes_mask', ctypes.c_uint64),
+        ('stx_atime', _StatxTimestamp),
+        ('stx_btime', _StatxTimestamp),
+        ('stx_ctime', _StatxTimestamp),
+        ('stx_mtime', _StatxTimestamp),
+        ('stx_rdev_major', ctypes.c_uint32),
+        ('stx_rdev_minor', ctypes.c_uint32),
+        ('stx_dev_major', ctypes.c_uint32),
+        ('stx_dev_minor', ctypes.c_uint32),
+        ('__spare2', ctypes.c_uint64 * 14),
+    ]
+
+
+def _load_statx():
+    """
+    Look up the statx wrapper exported by the C library.
+
+    Returns:
+        The ctypes function for statx, or None if it is not available
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        statx = libc.statx
+    except (OSError, AttributeError):
+        return None
+
+    statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int,
+                      ctypes.c_uint, ctypes.POINTER(_Statx)]
+    statx.restype = ctypes.c_int
+    return statx
+
+
+# Resolved once at import; reset to None if the kernel turns out not to
+# implement statx (ENOSYS), after which callers fall back to os.lstat
+_statx = _load_statx()
+
+
+def is_available() -> bool:
+    """
+    Check whether statx can be used on this system.
+
+    Returns:
+        bool: True if statx_size is backed by the statx system call
+    """
+    return _statx is not None
+
+
+def statx_size(path: str) -> StatxResult:
+    """
+    Get the type, size, link count and identity of a file without following symlinks.
+
+    Args:
+        path (str): Path to the file
+
+    Returns:
+        StatxResult: The file's st_mode, st_size, st_nlink, st_dev and st_ino
+
+    Raises:
+        OSError: If the file cannot be accessed
+    """
+    global _statx
+
+    if _statx is not None:
+        buf = _Statx()
+        result = _statx(AT_FDCWD, os.fsencode(path),
+                        AT_STATX_DONT_SYNC | AT_SYMLINK_NOFOLLOW,
+                        STATX_TYPE | STATX_SIZE | STATX_NLINK | STATX_INO,
+                        ctypes.byref(buf))
+        if result == 0:
+            return StatxResult(buf.stx_mode, buf.stx_size, buf.stx_nlink,
+                               os.makedev(buf.stx_dev_major, buf.stx_dev_minor),
+                               buf.stx_ino)
+
+        err = ctypes.get_errno()
+        if err != errno.ENOSYS:
+            raise OSError(err, os.strerror(err), path)
+        _statx = None
+
+    st = os.lstat(path)
+    return StatxResult(st.st_mode, st.st_size, st.st_nlink, st.st_dev, st.st_ino)
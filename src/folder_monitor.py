@@ -4,11 +4,189 @@ Folder Monitor Module
 This module provides functionality to monitor folder sizes and alert when they exceed defined limits.
 """
 
+import asyncio
+import errno
+import math
 import os
+import stat
+import threading
 import time
-from typing import Dict, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple, Union
 
+try:
+    from . import _statx
+except ImportError:
+    import _statx
 
+
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+@lru_cache(maxsize=1024)
+def _format_size(size_bytes: int) -> str:
+    """Format size in bytes to human-readable format (memoized)."""
+    # Each unit is 2**10 times the previous one, so the unit index can be
+    # read straight from the bit length instead of dividing repeatedly
+    unit_index = 0
+    if size_bytes >= 1024:
+        unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (unit_index * 10)):.2f} {SIZE_UNITS[unit_index]}"
+
+
+@dataclass(slots=True, frozen=True)
+class FolderLimit:
+    """
+    The size limit configured for a monitored folder.
+    
+    The limit never changes once configured, so it is formatted once here
+    rather than on every check.
+    
+    Attributes:
+        size_limit (int): Size limit in bytes
+        size_limit_formatted (str): Human-readable size limit
+    """
+    size_limit: int
+    size_limit_formatted: str
+    
+    @classmethod
+    def from_bytes(cls, size_limit: int) -> 'FolderLimit':
+        """
+        Create a limit from a size in bytes, formatting it.
+        
+        Args:
+            size_limit (int): Size limit in bytes
+            
+        Returns:
+            FolderLimit: The configured limit
+        """
+        return cls(size_limit, _format_size(size_limit))
+        
+        
+@dataclass(slots=True, frozen=True)
+class Violation:
+    """
+    A monitored folder that exceeded its size limit.
+    
+    Attributes:
+        folder_path (str): Path to the folder
+        current_size (int): Measured size of the folder in bytes
+        limit (FolderLimit): Size limit of the folder
+        current_size_at_least (bool): Whether current_size is only a lower bound
+                                      because the walk stopped at the limit
+    """
+    folder_path: str
+    current_size: int
+    limit: FolderLimit
+    current_size_at_least: bool = False
+    
+    @property
+    def size_limit(self) -> int:
+        """int: Size limit of the folder in bytes."""
+        return self.limit.size_limit
+        
+    @property
+    def excess_size(self) -> int:
+        """int: Number of bytes by which the folder exceeds its limit."""
+        return self.current_size - self.size_limit
+        
+    @property
+    def current_size_formatted(self) -> str:
+        """str: Human-readable current size."""
+        return _format_size(self.current_size)
+        
+    @property
+    def size_limit_formatted(self) -> str:
+        """str: Human-readable size limit."""
+        return self.limit.size_limit_formatted
+        
+    @property
+    def excess_size_formatted(self) -> str:
+        """str: Human-readable excess size."""
+        return _format_size(self.excess_size)
+        
+    def to_dict(self) -> Dict[str, any]:
+        """
+        Convert the violation to a dictionary, including the formatted sizes.
+        
+        Returns:
+            Dict[str, any]: Dictionary containing violation information
+        """
+        return {
+            'folder_path': self.folder_path,
+            'current_size': self.current_size,
+            'size_limit': self.size_limit,
+            'current_size_formatted': self.current_size_formatted,
+            'size_limit_formatted': self.size_limit_formatted,
+            'excess_size': self.excess_size,
+            'excess_size_formatted': self.excess_size_formatted,
+            'current_size_at_least': self.current_size_at_least
+        }
+        
+        
+@dataclass(slots=True, frozen=True)
+class FolderStatus:
+    """
+    The measured state of a monitored folder.
+    
+    Attributes:
+        path (str): Path to the folder
+        limit (FolderLimit): Size limit of the folder
+        current_size (int): Measured size of the folder in bytes
+        current_size_at_least (bool): Whether current_size is only a lower bound
+                                      because the walk stopped at the limit
+        error (str, optional): Why the folder could not be measured, if it couldn't
+    """
+    path: str
+    limit: FolderLimit
+    current_size: int = 0
+    current_size_at_least: bool = False
+    error: Optional[str] = None
+    
+    @property
+    def size_limit(self) -> int:
+        """int: Size limit of the folder in bytes."""
+        return self.limit.size_limit
+        
+    @property
+    def is_over_limit(self) -> bool:
+        """bool: Whether the folder exceeds its size limit."""
+        return self.error is None and self.current_size > self.size_limit
+        
+    @property
+    def usage_percentage(self) -> float:
+        """float: Current size as a percentage of the size limit."""
+        return (self.current_size / self.size_limit) * 100 if self.size_limit > 0 else 0
+        
+    def to_dict(self) -> Dict[str, any]:
+        """
+        Convert the status to a dictionary, including the formatted sizes.
+        
+        Returns:
+            Dict[str, any]: Dictionary containing folder status information. Folders
+                           that could not be measured carry only 'path' and 'error'.
+        """
+        if self.error is not None:
+            return {
+                'path': self.path,
+                'error': self.error
+            }
+            
+        return {
+            'path': self.path,
+            'current_size': self.current_size,
+            'current_size_formatted': _format_size(self.current_size),
+            'size_limit': self.size_limit,
+            'size_limit_formatted': self.limit.size_limit_formatted,
+            'usage_percentage': self.usage_percentage,
+            'is_over_limit': self.is_over_limit,
+            'current_size_at_least': self.current_size_at_least
+        }
+        
+        
 class FolderMonitor:
     """
     A class to monitor folder sizes and alert when they exceed predefined limits.
@@ -17,17 +195,59 @@ class FolderMonitor:
     size limits and provides alerting mechanisms when those limits are exceeded.
     """
     
-    def __init__(self, monitoring_config: Optional[Dict[str, int]] = None):
+    MAX_WORKERS = 32
+    # Seconds for which a folder that could not be measured is not retried
+    NEG_CACHE_TTL = 30
+    # Allowance, in nanoseconds, for file ctimes taken from a coarse clock
+    LINK_CTIME_SLACK_NS = 1_000_000_000
+    ALERT_TEMPLATE = (
+        "🚨 FOLDER SIZE ALERT 🚨\n"
+        "Folder: {folder_path}\n"
+        "Current Size: {at_least}{current_size_formatted}\n"
+        "Size Limit: {size_limit_formatted}\n"
+        "Excess: {at_least}{excess_size_formatted}\n"
+        "Time: {now}\n"
+        + "-" * 50
+    )
+    
+    def __init__(self, monitoring_config: Optional[Dict[str, Union[int, FolderLimit]]] = None,
+                 cache_ttl: float = 0, parallel: bool = True, use_statx: bool = False):
         """
         Initialize the FolderMonitor with monitoring configuration.
         
         Args:
-            monitoring_config (Dict[str, int], optional): Dictionary mapping folder paths 
-                                                         to size limits in bytes. 
-                                                         Defaults to None.
+            monitoring_config (Dict[str, Union[int, FolderLimit]], optional): Dictionary
+                                                         mapping folder paths to size
+                                                         limits, in bytes or as
+                                                         FolderLimit. Defaults to None.
+            cache_ttl (float, optional): Seconds for which the size of an unchanged
+                                         subdirectory may be reused between checks.
+                                         Defaults to 0 (caching disabled).
+            parallel (bool, optional): Whether to walk monitored folders concurrently.
+                                       Defaults to True.
+            use_statx (bool, optional): Whether to read file sizes with Linux statx and
+                                        AT_STATX_DONT_SYNC. This pays off on network
+                                        filesystems; on local disks the ctypes call
+                                        costs more than a plain lstat. Defaults to False.
         """
-        self.monitoring_config = monitoring_config or {}
+        self.monitoring_config: Dict[str, FolderLimit] = {
+            folder_path: limit if isinstance(limit, FolderLimit) else FolderLimit.from_bytes(limit)
+            for folder_path, limit in (monitoring_config or {}).items()
+        }
+        # Guards writes to monitoring_config against readers taking a snapshot
+        self._config_lock = threading.Lock()
         self.alerts_triggered = []
+        self.cache_ttl = cache_ttl
+        self.parallel = parallel
+        self.use_statx = use_statx
+        # Maps directory path -> (mtime_ns, subtree size, monotonic time of the
+        # oldest data the size was built from)
+        self._size_cache: Dict[str, Tuple[int, int, float]] = {}
+        # Maps directory path -> paths of the subdirectories found the last time
+        # it was listed, so entries for removed subdirectories can be dropped
+        self._subdirs: Dict[str, Tuple[str, ...]] = {}
+        # Maps folder path -> (monotonic expiry time, error raised measuring it)
+        self._neg_cache: Dict[str, Tuple[float, OSError]] = {}
         
     def add_folder_to_monitor(self, folder_path: str, size_limit_mb: int) -> bool:
         """
@@ -40,16 +260,19 @@ class FolderMonitor:
         Returns:
             bool: True if folder was added successfully, False otherwise
         """
-        if not os.path.exists(folder_path):
-            print(f"Warning: Folder '{folder_path}' does not exist.")
-            return False
-            
-        if not os.path.isdir(folder_path):
+        try:
+            self._stat_dir(folder_path)
+        except NotADirectoryError:
             print(f"Warning: '{folder_path}' is not a directory.")
             return False
+        except OSError:
+            print(f"Warning: Folder '{folder_path}' does not exist.")
+            return False
             
         size_limit_bytes = size_limit_mb * 1024 * 1024  # Convert MB to bytes
-        self.monitoring_config[folder_path] = size_limit_bytes
+        with self._config_lock:
+            self.monitoring_config[folder_path] = FolderLimit.from_bytes(size_limit_bytes)
+        self._neg_cache.pop(folder_path, None)
         print(f"Added folder '{folder_path}' to monitoring with limit {size_limit_mb} MB")
         return True
         
@@ -63,20 +286,60 @@ class FolderMonitor:
         Returns:
             bool: True if folder was removed successfully, False otherwise
         """
-        if folder_path in self.monitoring_config:
-            del self.monitoring_config[folder_path]
+        with self._config_lock:
+            removed = self.monitoring_config.pop(folder_path, None) is not None
+            
+        if removed:
+            self._invalidate_cache(folder_path)
+            self._neg_cache.pop(folder_path, None)
             print(f"Removed folder '{folder_path}' from monitoring")
             return True
         else:
             print(f"Folder '{folder_path}' is not being monitored")
             return False
             
-    def get_folder_size(self, folder_path: str) -> int:
+    def _stat_dir(self, folder_path: str) -> os.stat_result:
+        """
+        Stat a folder and check that it is a directory, with a single system call.
+        
+        Args:
+            folder_path (str): Path to the folder
+            
+        Returns:
+            os.stat_result: The folder's stat result
+            
+        Raises:
+            NotADirectoryError: If the path exists but is not a directory
+            OSError: If the path cannot be accessed
+        """
+        st = os.stat(folder_path)
+        if not stat.S_ISDIR(st.st_mode):
+            raise NotADirectoryError(errno.ENOTDIR, os.strerror(errno.ENOTDIR), folder_path)
+        return st
+        
+    def _config_items(self) -> Tuple[Tuple[str, FolderLimit], ...]:
+        """
+        Take a snapshot of the monitored folders and their size limits.
+        
+        The snapshot can be iterated, or handed to worker threads, while the
+        configuration is changed concurrently.
+        
+        Returns:
+            Tuple[Tuple[str, FolderLimit], ...]: (folder path, size limit) pairs
+        """
+        with self._config_lock:
+            return tuple(self.monitoring_config.items())
+            
+    def get_folder_size(self, folder_path: str, limit: Optional[int] = None) -> int:
         """
         Calculate the total size of a folder in bytes.
         
         Args:
             folder_path (str): Path to the folder
+            limit (int, optional): Stop walking once the total exceeds this many
+                                   bytes, checked after each directory is
+                                   listed. The result is then only a lower
+                                   bound of the folder size. Defaults to None.
             
         Returns:
             int: Total size of the folder in bytes
@@ -84,24 +347,417 @@ class FolderMonitor:
         Raises:
             OSError: If there's an error accessing the folder or its contents
         """
-        if not os.path.exists(folder_path):
-            raise OSError(f"Folder \'{folder_path}\' does not exist.")
-        if not os.path.isdir(folder_path):
-            raise OSError(f"\'{folder_path}\' is not a directory.")
+        return self._walk_size(folder_path, limit)[0]
+        
+    def _walk_size(self, folder_path: str, limit: Optional[int] = None,
+                   reuse: bool = True) -> Tuple[int, bool]:
+        """
+        Walk a folder tree and sum the sizes of its regular files.
+        
+        When caching is enabled, every directory cached under the folder is
+        first stat'ed (see _expire_changed_dirs), and entries made stale by a
+        changed mtime are dropped. If the folder's own entry survives, its
+        total is returned without listing anything, so an unchanged folder
+        costs one stat per directory. Otherwise the folder is walked, and a
+        subdirectory whose cached entry is still present is not descended
+        into; its cached subtree size is used instead.
+        A directory's mtime changes when entries are added, removed or renamed
+        directly inside it, so such changes are picked up on the next call
+        wherever they are in the tree. Files growing in place go unnoticed
+        until the entry expires after ``cache_ttl`` seconds. An entry built
+        from reused child entries keeps the oldest of their timestamps, so no
+        cached data outlives the TTL.
+        
+        A walk cut short by ``limit`` stores nothing in the cache, since its
+        subtotals are incomplete. Whenever a directory is listed, cached
+        entries for subdirectories it no longer contains are dropped, along
+        with everything cached beneath them; expired entries are dropped when
+        they are read.
+        
+        Files with several hard links are counted once per walk, keyed by
+        (st_dev, st_ino). Directories containing such a file, and their
+        ancestors, are not cached. A link made later to a file inside a cached
+        subtree raises its link count without changing that subtree's mtime,
+        so when a walk that reused cached entries finds a file with links it
+        did not see, and the file's ctime (which linking updates) is not older
+        than the oldest reused entry, the walk is redone without reusing any.
+        
+        Args:
+            folder_path (str): Path to the folder
+            limit (int, optional): Return once a listed directory brings the total
+                                   above this value
+            reuse (bool, optional): Whether cached entries may be reused. When False
+                                    the whole tree is walked, but the cache is still
+                                    updated. Defaults to True.
+            
+        Returns:
+            Tuple[int, bool]: Total size of the folder in bytes, and whether the
+                              walk stopped early so the size is only a lower
+                              bound above limit
+            
+        Raises:
+            OSError: If the folder itself cannot be listed
+        """
+        cache = self._size_cache if self.cache_ttl > 0 else None
+        cache_ttl = self.cache_ttl if reuse else 0
+        now = time.monotonic()
+        statx_size = _statx.statx_size if self.use_statx and _statx.is_available() else None
+        bound = math.inf if limit is None else limit
         
+        root_mtime_ns = 0
+        if cache is not None:
+            # The root entry carries the oldest timestamp in its subtree, so
+            # this answer is never older than cache_ttl
+            root_mtime_ns = self._stat_dir(folder_path).st_mtime_ns
+            self._expire_changed_dirs(folder_path)
+            cached = cache.get(folder_path)
+            if cached is not None:
+                if cached[0] == root_mtime_ns and now - cached[2] < cache_ttl:
+                    return cached[1], False
+                cache.pop(folder_path, None)
+                
+        # Directories still to be listed, as (path, index into walked). Without
+        # caching nothing is kept once a directory has been listed, and depth
+        # is not limited by recursion.
+        stack = deque([(folder_path, 0)])
         total_size = 0
+        # Only files with more than one link can repeat, so only those are
+        # tracked, as (st_dev, st_ino) -> [links not seen yet, st_ctime_ns]
+        seen_links = {}
+        # Oldest timestamp among the cached entries reused by this walk
+        oldest_reused = math.inf
         
-        for dirpath, dirnames, filenames in os.walk(folder_path):
-            for filename in filenames:
-                file_path = os.path.join(dirpath, filename)
-                try:
-                    if os.path.exists(file_path):
-                        total_size += os.path.getsize(file_path)
-                except (OSError, FileNotFoundError):
-                    # Skip files that can\'t be accessed
+        # With caching enabled, every directory walked in this pass is also
+        # kept as (path, mtime_ns, parent index) so subtree sizes can be rolled
+        # up afterwards; subtotals[i] is the size found directly inside walked[i]
+        # and stamps[i] the oldest cache time of any entry reused beneath it
+        walked = [(folder_path, root_mtime_ns, -1)]
+        subtotals = [0]
+        stamps = [now]
+        # Indices into walked of directories holding a file with several hard links
+        linked = set()
+        
+        # The per-entry loop below runs once per file in the tree, so the
+        # lookups it needs are bound to locals up front
+        walked_append = walked.append
+        subtotals_append = subtotals.append
+        stamps_append = stamps.append
+        stack_append = stack.append
+        subdirs_cache = self._subdirs
+        
+        while stack:
+            path, index = stack.pop()
+            try:
+                scanner = os.scandir(path)
+            except OSError:
+                if path is folder_path:
+                    raise
+                # Skip subdirectories that can't be listed
+                continue
+                
+            # With follow_symlinks=False the type checks are answered from the
+            # d_type scandir already read, so each file costs a single lstat.
+            # Sizes are gathered per directory and reduced with the built-in
+            # sum(), keeping the additions out of the interpreted loop.
+            sizes = []
+            sizes_append = sizes.append
+            subdirs = []
+            with scanner:
+                for entry in scanner:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if cache is None:
+                                stack_append((entry.path, 0))
+                                continue
+                            subdirs.append(entry.path)
+                            mtime_ns = entry.stat(follow_symlinks=False).st_mtime_ns
+                            cached = cache.get(entry.path)
+                            if cached is not None:
+                                if cached[0] == mtime_ns and now - cached[2] < cache_ttl:
+                                    sizes_append(cached[1])
+                                    if cached[2] < stamps[index]:
+                                        stamps[index] = cached[2]
+                                    if cached[2] < oldest_reused:
+                                        oldest_reused = cached[2]
+                                    continue
+                                cache.pop(entry.path, None)
+                            walked_append((entry.path, mtime_ns, index))
+                            subtotals_append(0)
+                            stamps_append(now)
+                            stack_append((entry.path, len(walked) - 1))
+                        elif entry.is_file(follow_symlinks=False):
+                            if statx_size is not None:
+                                st = statx_size(entry.path)
+                            else:
+                                st = entry.stat(follow_symlinks=False)
+                            if st.st_nlink > 1:
+                                linked.add(index)
+                                link_key = (st.st_dev, st.st_ino)
+                                seen = seen_links.get(link_key)
+                                if seen is not None:
+                                    seen[0] -= 1
+                                    continue
+                                ctime_ns = 0
+                                if cache is not None:
+                                    # statx results carry no ctime
+                                    ctime_ns = (st if statx_size is None else
+                                                entry.stat(follow_symlinks=False)).st_ctime_ns
+                                seen_links[link_key] = [st.st_nlink - 1, ctime_ns]
+                            sizes_append(st.st_size)
+                    except OSError:
+                        # Skip entries that can't be accessed
+                        continue
+            if cache is not None:
+                old_subdirs = subdirs_cache.get(path)
+                subdirs_cache[path] = tuple(subdirs)
+                if old_subdirs:
+                    removed = set(old_subdirs).difference(subdirs)
+                    if removed:
+                        self._drop_cached_dirs(removed)
+            subtotal = sum(sizes)
+            total_size += subtotal
+            if total_size > bound and stack:
+                if self._links_may_be_cached(seen_links, oldest_reused):
+                    return self._walk_size(folder_path, limit, reuse=False)
+                return total_size, True
+            if cache is not None:
+                subtotals[index] += subtotal
+                
+        if self._links_may_be_cached(seen_links, oldest_reused):
+            return self._walk_size(folder_path, limit, reuse=False)
+            
+        if cache is not None:
+            # Children are always walked after their parent, so rolling up in
+            # reverse order sees every subtree complete before its parent
+            for index in range(len(walked) - 1, -1, -1):
+                path, mtime_ns, parent = walked[index]
+                if parent >= 0:
+                    subtotals[parent] += subtotals[index]
+                    if stamps[index] < stamps[parent]:
+                        stamps[parent] = stamps[index]
+                if index in linked:
+                    if parent >= 0:
+                        linked.add(parent)
                     continue
+                cache[path] = (mtime_ns, subtotals[index], stamps[index])
+                
+        return total_size, False
+        
+    def _links_may_be_cached(self, seen_links: Dict[Tuple[int, int], List[int]],
+                             oldest_reused: float) -> bool:
+        """
+        Check whether a walk may have counted a hard-linked file twice.
+        
+        That happens when a reused cached subtree already counted a file that
+        was then linked into a part of the tree the walk listed. Linking
+        updates the file's ctime, so only files whose ctime is not older than
+        the oldest reused entry, and which have links the walk did not see,
+        are suspects.
+        
+        Args:
+            seen_links (Dict[Tuple[int, int], List[int]]): Multiply-linked files found
+                                                          by the walk, as (st_dev, st_ino)
+                                                          -> [links not seen, st_ctime_ns]
+            oldest_reused (float): Monotonic timestamp of the oldest reused cache
+                                   entry, or infinity if none was reused
             
-        return total_size
+        Returns:
+            bool: True if the walk must be redone without reusing cached entries
+        """
+        if oldest_reused == math.inf or not seen_links:
+            return False
+            
+        # Wall-clock time at which the oldest reused data was read
+        cached_at_ns = (time.time_ns() - int((time.monotonic() - oldest_reused) * 1e9)
+                        - self.LINK_CTIME_SLACK_NS)
+        return any(unseen > 0 and ctime_ns >= cached_at_ns
+                   for unseen, ctime_ns in seen_links.values())
+        
+    def _expire_changed_dirs(self, folder_path: str) -> None:
+        """
+        Drop cached sizes made stale by a change anywhere beneath a folder.
+        
+        Every cached directory found under the folder when it was last walked
+        is stat'ed, without listing any. One whose mtime no longer matches its
+        entry is dropped together with the entries of its ancestors, whose
+        totals include it, so the next walk lists that whole chain again
+        while still reusing its unchanged siblings.
+        
+        Args:
+            folder_path (str): Path to the folder; its own mtime is left to the caller
+        """
+        cache = self._size_cache
+        subdirs = self._subdirs
+        # Directories found so far, and the index of each one's parent in paths
+        paths = [folder_path]
+        parents = [-1]
+        
+        index = 0
+        while index < len(paths):
+            path = paths[index]
+            cached = cache.get(path)
+            if cached is not None and index > 0:
+                try:
+                    mtime_ns = os.stat(path, follow_symlinks=False).st_mtime_ns
+                except OSError:
+                    mtime_ns = None
+                if mtime_ns != cached[0]:
+                    ancestor = index
+                    while ancestor >= 0:
+                        cache.pop(paths[ancestor], None)
+                        ancestor = parents[ancestor]
+            children = subdirs.get(path)
+            if children:
+                paths.extend(children)
+                parents.extend([index] * len(children))
+            index += 1
+            
+    def _drop_cached_dirs(self, paths: Set[str]) -> None:
+        """
+        Drop cached entries for directories and everything cached beneath them.
+        
+        Only the dropped subtrees are visited, found through the subdirectory
+        lists recorded when they were last listed.
+        
+        Args:
+            paths (Set[str]): Paths of the directories to drop
+        """
+        stack = list(paths)
+        while stack:
+            path = stack.pop()
+            self._size_cache.pop(path, None)
+            stack.extend(self._subdirs.pop(path, ()))
+            
+    def _invalidate_cache(self, folder_path: str) -> None:
+        """
+        Drop cached subtree sizes for a folder and everything beneath it.
+        
+        Args:
+            folder_path (str): Path to the folder
+        """
+        prefix = os.path.join(folder_path, '')
+        for cache in (self._size_cache, self._subdirs):
+            cache.pop(folder_path, None)
+            for path in [p for p in cache if p.startswith(prefix)]:
+                del cache[path]
+            
+    def _measure_folder(self, folder_path: str,
+                        limit: Optional[int] = None) -> Union[Tuple[int, bool], OSError]:
+        """
+        Calculate the size of a folder, returning any error instead of raising it.
+        
+        A folder that failed is not retried for NEG_CACHE_TTL seconds; the
+        same error is returned without touching the filesystem.
+        
+        Args:
+            folder_path (str): Path to the folder
+            limit (int, optional): Limit passed on to _walk_size. Defaults to None.
+            
+        Returns:
+            Union[Tuple[int, bool], OSError]: Size of the folder in bytes and whether
+                                              it is only a lower bound, or the error
+                                              raised while walking it
+        """
+        now = time.monotonic()
+        failed = self._neg_cache.get(folder_path)
+        if failed is not None and now < failed[0]:
+            return failed[1]
+            
+        try:
+            size = self._walk_size(folder_path, limit)
+        except OSError as e:
+            self._neg_cache[folder_path] = (now + self.NEG_CACHE_TTL, e)
+            return e
+            
+        self._neg_cache.pop(folder_path, None)
+        return size
+            
+    def _measure_folders(self, folder_paths: List[str],
+                         limits: Optional[Dict[str, int]] = None
+                         ) -> Dict[str, Union[Tuple[int, bool], OSError]]:
+        """
+        Calculate the size of several folders, walking them concurrently if enabled.
+        
+        Folder walks are dominated by filesystem calls that release the GIL, so
+        independent folders overlap well on a thread pool.
+        
+        Args:
+            folder_paths (List[str]): Paths of the folders to measure
+            limits (Dict[str, int], optional): Per-folder limits passed on to
+                                               _walk_size. Defaults to None.
+            
+        Returns:
+            Dict[str, Union[Tuple[int, bool], OSError]]: Mapping of folder path to its
+                                                         size and lower-bound flag, or
+                                                         to the error raised while
+                                                         walking it
+        """
+        results = {}
+        limits = limits or {}
+        
+        if self.parallel and len(folder_paths) > 1:
+            max_workers = min(self.MAX_WORKERS, len(folder_paths))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._measure_folder, folder_path,
+                                    limits.get(folder_path)): folder_path
+                    for folder_path in folder_paths
+                }
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+        else:
+            for folder_path in folder_paths:
+                results[folder_path] = self._measure_folder(folder_path,
+                                                            limits.get(folder_path))
+                    
+        return results
+        
+    def _collect(self, exact: bool = True,
+                 sizes: Optional[Dict[str, Union[Tuple[int, bool], OSError]]] = None,
+                 items: Optional[Tuple[Tuple[str, FolderLimit], ...]] = None) -> List[FolderStatus]:
+        """
+        Measure every monitored folder once and describe it against its limit.
+        
+        This is the single pass shared by check_folder_limits and
+        get_monitoring_status.
+        
+        Args:
+            exact (bool): Whether sizes must be exact. When False, walks stop
+                          once a folder is known to exceed its limit, and the
+                          status's current_size_at_least flag is set for those
+                          that stopped early. Defaults to True.
+            sizes (Dict[str, Union[Tuple[int, bool], OSError]], optional): Results already
+                                                                          measured for every
+                                                                          folder. Defaults to
+                                                                          None (measure now).
+            items (Tuple[Tuple[str, FolderLimit], ...], optional): Configuration snapshot
+                                                                  the sizes were measured
+                                                                  for. Defaults to None
+                                                                  (take one now).
+        
+        Returns:
+            List[FolderStatus]: One status per monitored folder, in configuration order
+        """
+        records = []
+        if items is None:
+            items = self._config_items()
+        if sizes is None:
+            limits = None if exact else {
+                folder_path: limit.size_limit for folder_path, limit in items
+            }
+            sizes = self._measure_folders([folder_path for folder_path, _ in items], limits)
+            
+        for folder_path, limit in items:
+            result = sizes[folder_path]
+            if isinstance(result, OSError):
+                records.append(FolderStatus(folder_path, limit, error=str(result)))
+                continue
+                
+            current_size, at_least = result
+            records.append(FolderStatus(folder_path, limit, current_size,
+                                        current_size_at_least=at_least))
+            
+        return records
         
     def format_size(self, size_bytes: int) -> str:
         """
@@ -113,61 +769,66 @@ class FolderMonitor:
         Returns:
             str: Formatted size string (e.g., "1.5 GB", "256 MB")
         """
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} PB"
+        return _format_size(size_bytes)
         
-    def check_folder_limits(self) -> List[Dict[str, any]]:
+    def check_folder_limits(self) -> List[Violation]:
         """
         Check all monitored folders against their size limits.
         
         Returns:
-            List[Dict[str, any]]: List of dictionaries containing information about 
-                                 folders that exceeded their limits
+            List[Violation]: Folders that exceeded their limits
+        """
+        return self._find_violations(self._collect(exact=False))
+        
+    def _find_violations(self, records: List[FolderStatus],
+                         out: Optional[List[str]] = None) -> List[Violation]:
+        """
+        Build violations for the folder statuses that exceed their limits.
+        
+        Args:
+            records (List[FolderStatus]): Folder statuses produced by _collect
+            out (List[str], optional): Buffer to collect output lines in instead of
+                                       printing them. Defaults to None.
+            
+        Returns:
+            List[Violation]: Folders that exceeded their limits
         """
         violations = []
         
-        for folder_path, size_limit in self.monitoring_config.items():
-            try:
-                current_size = self.get_folder_size(folder_path)
+        for record in records:
+            if record.error is not None:
+                self._emit(f"Error checking folder '{record.path}': {record.error}", out)
+                continue
                 
-                if current_size > size_limit:
-                    violation = {
-                        'folder_path': folder_path,
-                        'current_size': current_size,
-                        'size_limit': size_limit,
-                        'current_size_formatted': self.format_size(current_size),
-                        'size_limit_formatted': self.format_size(size_limit),
-                        'excess_size': current_size - size_limit,
-                        'excess_size_formatted': self.format_size(current_size - size_limit)
-                    }
-                    violations.append(violation)
-                    
-            except OSError as e:
-                print(f"Error checking folder '{folder_path}': {e}")
+            if record.is_over_limit:
+                violations.append(Violation(record.path, record.current_size,
+                                            record.limit, record.current_size_at_least))
                 
         return violations
         
-    def trigger_alert(self, violation: Dict[str, any]) -> None:
+    def trigger_alert(self, violation: Violation, now_str: Optional[str] = None,
+                      out: Optional[List[str]] = None) -> None:
         """
         Trigger an alert for a folder size violation.
         
         Args:
-            violation (Dict[str, any]): Dictionary containing violation information
+            violation (Violation): The violation to alert on
+            now_str (str, optional): Timestamp to show in the alert, so that a check
+                                     raising several alerts formats it once.
+                                     Defaults to None (current local time).
+            out (List[str], optional): Buffer to collect the alert in instead of
+                                       printing it. Defaults to None.
         """
-        alert_message = (
-            f"🚨 FOLDER SIZE ALERT 🚨\n"
-            f"Folder: {violation['folder_path']}\n"
-            f"Current Size: {violation['current_size_formatted']}\n"
-            f"Size Limit: {violation['size_limit_formatted']}\n"
-            f"Excess: {violation['excess_size_formatted']}\n"
-            f"Time: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
-            f"{'-' * 50}"
-        )
+        if now_str is None:
+            now_str = time.strftime('%Y-%m-%d %H:%M:%S')
+            
+        alert_message = self.ALERT_TEMPLATE.format_map(violation.to_dict() | {
+            'now': now_str,
+            # Sizes from a walk that stopped at the limit are lower bounds
+            'at_least': "at least " if violation.current_size_at_least else ""
+        })
         
-        print(alert_message)
+        self._emit(alert_message, out)
         self.alerts_triggered.append({
             'timestamp': time.time(),
             'violation': violation,
@@ -185,16 +846,79 @@ class FolderMonitor:
             print("No folders configured for monitoring.")
             return False
             
-        violations = self.check_folder_limits()
+        return self._report(self._collect(exact=False))
+        
+    async def monitor_once_async(self) -> bool:
+        """
+        Perform a single monitoring check, walking folders concurrently in threads.
+        
+        Each folder walk is dispatched as one call to the default executor, so
+        the event loop stays free while the filesystem is being read. With
+        parallel disabled, the folders are walked one after another in a
+        single executor call instead.
+        
+        Returns:
+            bool: True if any violations were found, False otherwise
+        """
+        if not self.monitoring_config:
+            print("No folders configured for monitoring.")
+            return False
+            
+        items = self._config_items()
+        if self.parallel:
+            results = await asyncio.gather(*(
+                asyncio.to_thread(self._measure_folder, folder_path, limit.size_limit)
+                for folder_path, limit in items
+            ))
+            sizes = {folder_path: result for (folder_path, _), result in zip(items, results)}
+        else:
+            sizes = await asyncio.to_thread(
+                self._measure_folders,
+                [folder_path for folder_path, _ in items],
+                {folder_path: limit.size_limit for folder_path, limit in items}
+            )
+        
+        return self._report(self._collect(exact=False, sizes=sizes, items=items))
+        
+    def _report(self, records: List[FolderStatus]) -> bool:
+        """
+        Report the outcome of a monitoring check and trigger alerts for its violations.
+        
+        All output of the check is buffered and printed in one call, rather
+        than one print per line.
+        
+        Args:
+            records (List[FolderStatus]): Folder statuses produced by _collect
+            
+        Returns:
+            bool: True if any violations were found, False otherwise
+        """
+        out = []
+        violations = self._find_violations(records, out)
         
         if violations:
-            print(f"Found {len(violations)} folder size violation(s):")
+            out.append(f"Found {len(violations)} folder size violation(s):")
+            now_str = time.strftime('%Y-%m-%d %H:%M:%S')
             for violation in violations:
-                self.trigger_alert(violation)
-            return True
+                self.trigger_alert(violation, now_str, out)
         else:
-            print("All monitored folders are within their size limits.")
-            return False
+            out.append("All monitored folders are within their size limits.")
+            
+        print("\n".join(out))
+        return bool(violations)
+        
+    def _emit(self, message: str, out: Optional[List[str]] = None) -> None:
+        """
+        Print a message, or append it to an output buffer if one is given.
+        
+        Args:
+            message (str): The message to output
+            out (List[str], optional): Buffer to append to. Defaults to None.
+        """
+        if out is None:
+            print(message)
+        else:
+            out.append(message)
             
     def monitor_continuously(self, check_interval: int = 60) -> None:
         """
@@ -215,6 +939,34 @@ class FolderMonitor:
         except KeyboardInterrupt:
             print("\nMonitoring stopped by user.")
             
+    async def monitor_continuously_async(self, check_interval: int = 60) -> None:
+        """
+        Monitor folders continuously at specified intervals using asyncio.
+        
+        Cancellation is propagated after the stop message is printed, so the
+        caller (e.g. asyncio.run on Ctrl+C) still sees the task as cancelled.
+        
+        Args:
+            check_interval (int): Time interval between checks in seconds (default: 60)
+            
+        Raises:
+            asyncio.CancelledError: If the monitoring task is cancelled
+        """
+        print(f"Starting continuous monitoring (checking every {check_interval} seconds)")
+        print("Press Ctrl+C to stop monitoring")
+        
+        try:
+            while True:
+                print(f"\n[{time.strftime('%Y-%m-%d %H:%M:%S')}] Checking folder sizes...")
+                await self.monitor_once_async()
+                await asyncio.sleep(check_interval)
+                
+        except KeyboardInterrupt:
+            print("\nMonitoring stopped by user.")
+        except asyncio.CancelledError:
+            print("\nMonitoring stopped by user.")
+            raise
+            
     def get_monitoring_status(self) -> Dict[str, any]:
         """
         Get the current monitoring status and configuration.
@@ -222,30 +974,11 @@ class FolderMonitor:
         Returns:
             Dict[str, any]: Dictionary containing monitoring status information
         """
+        records = self._collect()
         status = {
-            'total_folders_monitored': len(self.monitoring_config),
-            'folders': [],
+            'total_folders_monitored': len(records),
+            'folders': [record.to_dict() for record in records],
             'total_alerts_triggered': len(self.alerts_triggered)
         }
         
-        for folder_path, size_limit in self.monitoring_config.items():
-            try:
-                current_size = self.get_folder_size(folder_path)
-                folder_info = {
-                    'path': folder_path,
-                    'current_size': current_size,
-                    'current_size_formatted': self.format_size(current_size),
-                    'size_limit': size_limit,
-                    'size_limit_formatted': self.format_size(size_limit),
-                    'usage_percentage': (current_size / size_limit) * 100 if size_limit > 0 else 0,
-                    'is_over_limit': current_size > size_limit
-                }
-                status['folders'].append(folder_info)
-            except OSError as e:
-                status['folders'].append({
-                    'path': folder_path,
-                    'error': str(e)
-                })
-                
         return status
-
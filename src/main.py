@@ -4,6 +4,7 @@ Main Module
 This module contains the main execution logic for the Folder Monitor application.
 """
 
+import asyncio
 import sys
 import os
 from typing import Optional
@@ -157,7 +158,11 @@ class Main:
             return
             
         print(f"\n🚀 Starting continuous monitoring...")
-        self.monitor.monitor_continuously(interval)
+        try:
+            asyncio.run(self.monitor.monitor_continuously_async(interval))
+        except KeyboardInterrupt:
+            # The monitoring loop has already reported that it stopped
+            pass
         
     def view_status_interactive(self) -> None:
         """Interactive method to view monitoring status."""
@@ -5,16 +5,18 @@ This module contains comprehensive tests for the folder monitoring functionality
 including size calculation, limit checking, and alert mechanisms.
 """
 
+import asyncio
 import os
 import tempfile
 import shutil
+import time
 import pytest
 from unittest.mock import patch, MagicMock
 
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from src.folder_monitor import FolderMonitor
+from src.folder_monitor import FolderLimit, FolderMonitor, FolderStatus, Violation
 
 
 class TestFolderMonitor:
@@ -56,7 +58,7 @@ class TestFolderMonitor:
         """Test FolderMonitor initialization with custom configuration."""
         config = {'/test/path': 1024}
         monitor = FolderMonitor(config)
-        assert monitor.monitoring_config == config
+        assert monitor.monitoring_config == {'/test/path': FolderLimit(1024, '1.00 KB')}
         assert monitor.alerts_triggered == []
         
     def test_add_folder_to_monitor_success(self):
@@ -66,7 +68,8 @@ class TestFolderMonitor:
         
         assert result is True
         assert self.temp_dir in self.monitor.monitoring_config
-        assert self.monitor.monitoring_config[self.temp_dir] == size_limit_mb * 1024 * 1024
+        assert self.monitor.monitoring_config[self.temp_dir].size_limit == size_limit_mb * 1024 * 1024
+        assert self.monitor.monitoring_config[self.temp_dir].size_limit_formatted == "10.00 MB"
         
     def test_add_folder_to_monitor_nonexistent(self):
         """Test adding a non-existent folder to monitor."""
@@ -84,6 +87,14 @@ class TestFolderMonitor:
         assert result is False
         assert file_path not in self.monitor.monitoring_config
         
+    def test_add_folder_to_monitor_stats_once(self):
+        """Test that adding a folder checks it with a single stat call."""
+        with patch('os.stat', wraps=os.stat) as mock_stat:
+            result = self.monitor.add_folder_to_monitor(self.temp_dir, 10)
+            
+        assert result is True
+        mock_stat.assert_called_once_with(self.temp_dir)
+        
     def test_remove_folder_from_monitor_success(self):
         """Test successfully removing a folder from monitor."""
         self.monitor.add_folder_to_monitor(self.temp_dir, 10)
@@ -98,6 +109,23 @@ class TestFolderMonitor:
         
         assert result is False
         
+    def test_check_folder_limits_uses_config_snapshot(self):
+        """Test that folders added during a check are not picked up mid-check."""
+        other_dir = os.path.join(self.temp_dir, 'other')
+        os.makedirs(other_dir)
+        self.monitor.add_folder_to_monitor(self.temp_dir, 10)
+        original_walk_size = self.monitor._walk_size
+        
+        def add_folder_while_measuring(folder_path, limit=None):
+            self.monitor.monitoring_config[other_dir] = FolderLimit.from_bytes(0)
+            return original_walk_size(folder_path, limit)
+            
+        with patch.object(self.monitor, '_walk_size', add_folder_while_measuring):
+            violations = self.monitor.check_folder_limits()
+            
+        assert violations == []
+        assert other_dir in self.monitor.monitoring_config
+        
     def test_get_folder_size_empty_folder(self):
         """Test getting size of an empty folder."""
         size = self.monitor.get_folder_size(self.temp_dir)
@@ -136,6 +164,361 @@ class TestFolderMonitor:
         with pytest.raises(OSError):
             self.monitor.get_folder_size('/path/that/does/not/exist')
             
+    def test_get_folder_size_not_directory(self):
+        """Test getting size of a path that is a file, not a directory."""
+        file_path = self.create_test_file('test.txt', 100)
+        with pytest.raises(OSError):
+            self.monitor.get_folder_size(file_path)
+            
+    def test_get_folder_size_deeply_nested(self):
+        """Test getting size of a deeply nested directory tree."""
+        path = self.temp_dir
+        for i in range(50):
+            path = os.path.join(path, f'level{i}')
+        os.makedirs(path)
+        with open(os.path.join(path, 'deep.txt'), 'wb') as f:
+            f.write(b'0' * 512)
+            
+        assert self.monitor.get_folder_size(self.temp_dir) == 512
+        
+    def test_get_folder_size_uses_directory_entry_metadata(self):
+        """Test that the walk takes sizes from scandir entries, not extra stat calls."""
+        self.create_test_file('file1.txt', 1024)
+        os.makedirs(os.path.join(self.temp_dir, 'subdir'))
+        
+        with patch('os.path.getsize') as mock_getsize, \
+                patch('os.path.exists') as mock_exists, \
+                patch('os.stat') as mock_stat:
+            assert self.monitor.get_folder_size(self.temp_dir) == 1024
+            
+        mock_getsize.assert_not_called()
+        mock_exists.assert_not_called()
+        mock_stat.assert_not_called()
+        
+    @pytest.mark.skipif(not hasattr(os, 'symlink'), reason="symlinks not supported")
+    def test_get_folder_size_does_not_follow_symlinks(self):
+        """Test that symlinked files and directories are not counted."""
+        outside_dir = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(outside_dir, 'big.txt'), 'wb') as f:
+                f.write(b'0' * 4096)
+            self.create_test_file('file1.txt', 1024)
+            os.symlink(os.path.join(outside_dir, 'big.txt'),
+                       os.path.join(self.temp_dir, 'link.txt'))
+            os.symlink(outside_dir, os.path.join(self.temp_dir, 'linkdir'))
+            
+            assert self.monitor.get_folder_size(self.temp_dir) == 1024
+        finally:
+            shutil.rmtree(outside_dir)
+            
+    @pytest.mark.skipif(not hasattr(os, 'link'), reason="hard links not supported")
+    def test_get_folder_size_counts_hard_links_once(self):
+        """Test that a file reachable through several hard links is counted once."""
+        subdir = os.path.join(self.temp_dir, 'subdir')
+        os.makedirs(subdir)
+        file_path = self.create_test_file('file1.txt', 1024)
+        self.create_test_file('file2.txt', 512)
+        os.link(file_path, os.path.join(self.temp_dir, 'link1.txt'))
+        os.link(file_path, os.path.join(subdir, 'link2.txt'))
+        
+        assert self.monitor.get_folder_size(self.temp_dir) == 1536
+        assert FolderMonitor(use_statx=True).get_folder_size(self.temp_dir) == 1536
+        
+    @pytest.mark.skipif(not hasattr(os, 'link'), reason="hard links not supported")
+    def test_get_folder_size_does_not_cache_hard_linked_subtrees(self):
+        """Test that hard-linked files are counted once even when caching is enabled."""
+        monitor = FolderMonitor(cache_ttl=60)
+        dir_a = os.path.join(self.temp_dir, 'a')
+        dir_b = os.path.join(self.temp_dir, 'b')
+        dir_c = os.path.join(self.temp_dir, 'c')
+        for path in (dir_a, dir_b, dir_c):
+            os.makedirs(path)
+        with open(os.path.join(dir_a, 'shared.txt'), 'wb') as f:
+            f.write(b'0' * 1024)
+        os.link(os.path.join(dir_a, 'shared.txt'), os.path.join(dir_b, 'shared.txt'))
+        with open(os.path.join(dir_c, 'plain.txt'), 'wb') as f:
+            f.write(b'0' * 512)
+            
+        assert monitor.get_folder_size(self.temp_dir) == 1536
+        
+        # Changing one sibling must not count the shared file a second time
+        with open(os.path.join(dir_a, 'new.txt'), 'wb') as f:
+            f.write(b'0' * 256)
+        assert monitor.get_folder_size(self.temp_dir) == 1792
+        assert monitor.get_folder_size(self.temp_dir) == 1792
+        
+        for path in (self.temp_dir, dir_a, dir_b):
+            assert path not in monitor._size_cache
+        assert monitor._size_cache[dir_c][1] == 512
+        
+    @pytest.mark.skipif(not hasattr(os, 'link'), reason="hard links not supported")
+    def test_get_folder_size_link_into_cached_subtree_counted_once(self):
+        """Test that linking a file out of a cached subtree does not count it twice."""
+        monitor = FolderMonitor(cache_ttl=60)
+        dir_a = os.path.join(self.temp_dir, 'a')
+        dir_b = os.path.join(self.temp_dir, 'b')
+        os.makedirs(dir_a)
+        os.makedirs(dir_b)
+        with open(os.path.join(dir_a, 'f'), 'wb') as f:
+            f.write(b'0' * 1000)
+            
+        assert monitor.get_folder_size(self.temp_dir) == 1000
+        assert dir_a in monitor._size_cache
+        
+        os.link(os.path.join(dir_a, 'f'), os.path.join(dir_b, 'f2'))
+        mtime_ns = os.stat(self.temp_dir).st_mtime_ns
+        os.utime(self.temp_dir, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+        
+        assert FolderMonitor().get_folder_size(self.temp_dir) == 1000
+        assert monitor.get_folder_size(self.temp_dir) == 1000
+        assert monitor.get_folder_size(self.temp_dir) == 1000
+        assert dir_a not in monitor._size_cache
+        
+    @pytest.mark.skipif(not hasattr(os, 'link'), reason="hard links not supported")
+    def test_get_folder_size_older_outside_link_keeps_cache(self):
+        """Test that a file linked from outside before caching does not force a full walk."""
+        monitor = FolderMonitor(cache_ttl=60)
+        monitor.LINK_CTIME_SLACK_NS = 0
+        outside_dir = tempfile.mkdtemp()
+        try:
+            os.makedirs(os.path.join(self.temp_dir, 'cached'))
+            file_path = self.create_test_file('shared.txt', 1024)
+            os.link(file_path, os.path.join(outside_dir, 'shared.txt'))
+            time.sleep(0.05)
+            assert monitor.get_folder_size(self.temp_dir) == 1024
+            
+            mtime_ns = os.stat(self.temp_dir).st_mtime_ns
+            os.utime(self.temp_dir, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+            with patch.object(monitor, '_walk_size', wraps=monitor._walk_size) as mock_walk:
+                assert monitor.get_folder_size(self.temp_dir) == 1024
+            mock_walk.assert_called_once_with(self.temp_dir, None)
+        finally:
+            shutil.rmtree(outside_dir)
+            
+    def test_get_folder_size_with_statx(self):
+        """Test that reading sizes through statx gives the same total."""
+        monitor = FolderMonitor(use_statx=True)
+        subdir = os.path.join(self.temp_dir, 'subdir')
+        os.makedirs(subdir)
+        self.create_test_file('file1.txt', 1024)
+        with open(os.path.join(subdir, 'file2.txt'), 'wb') as f:
+            f.write(b'0' * 2048)
+            
+        assert monitor.get_folder_size(self.temp_dir) == 3072
+        
+    def test_get_folder_size_reuses_cache_for_unchanged_subdirectory(self):
+        """Test that an unchanged subdirectory is served from the size cache."""
+        monitor = FolderMonitor(cache_ttl=60)
+        subdir = os.path.join(self.temp_dir, 'subdir')
+        os.makedirs(subdir)
+        file_path = os.path.join(subdir, 'file.txt')
+        with open(file_path, 'wb') as f:
+            f.write(b'0' * 1024)
+            
+        assert monitor.get_folder_size(self.temp_dir) == 1024
+        assert monitor._size_cache[subdir][1] == 1024
+        
+        # Growing a file in place does not touch the directory mtime
+        with open(file_path, 'ab') as f:
+            f.write(b'0' * 1024)
+        assert monitor.get_folder_size(self.temp_dir) == 1024
+        
+        # A new mtime on the subdirectory forces it to be walked again
+        mtime_ns = os.stat(subdir).st_mtime_ns
+        os.utime(subdir, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+        assert monitor.get_folder_size(self.temp_dir) == 2048
+        
+    def test_get_folder_size_skips_walk_for_unchanged_folder(self):
+        """Test that an unchanged folder is answered from the cache with one stat."""
+        monitor = FolderMonitor(cache_ttl=60)
+        self.create_test_file('file1.txt', 1024)
+        
+        assert monitor.get_folder_size(self.temp_dir) == 1024
+        with patch('os.scandir') as mock_scandir:
+            assert monitor.get_folder_size(self.temp_dir) == 1024
+        mock_scandir.assert_not_called()
+        
+        self.create_test_file('file2.txt', 2048)
+        mtime_ns = os.stat(self.temp_dir).st_mtime_ns
+        os.utime(self.temp_dir, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+        assert monitor.get_folder_size(self.temp_dir) == 3072
+        
+    def test_get_folder_size_sees_changes_below_unchanged_folder(self):
+        """Test that files added in subdirectories are found while the folder's own mtime is unchanged."""
+        monitor = FolderMonitor(cache_ttl=60)
+        sub_dir = os.path.join(self.temp_dir, 's')
+        deep_dir = os.path.join(sub_dir, 't', 'u')
+        os.makedirs(deep_dir)
+        root_mtime_ns = os.stat(self.temp_dir).st_mtime_ns
+        assert monitor.get_folder_size(self.temp_dir) == 0
+        
+        with open(os.path.join(sub_dir, 'new'), 'wb') as f:
+            f.write(b'0' * 4096)
+        assert os.stat(self.temp_dir).st_mtime_ns == root_mtime_ns
+        assert monitor.get_folder_size(self.temp_dir) == 4096
+        
+        with open(os.path.join(deep_dir, 'new'), 'wb') as f:
+            f.write(b'0' * 1024)
+        assert monitor.get_folder_size(self.temp_dir) == 5120
+        
+        # Unchanged directories are only stat'ed, never listed again
+        with patch('os.scandir') as mock_scandir:
+            assert monitor.get_folder_size(self.temp_dir) == 5120
+        mock_scandir.assert_not_called()
+        
+    def test_get_folder_size_cache_expires(self):
+        """Test that cached sizes are not reused once the TTL has passed."""
+        monitor = FolderMonitor(cache_ttl=60)
+        file_path = self.create_test_file('file1.txt', 1024)
+        monitor.get_folder_size(self.temp_dir)
+        with open(file_path, 'ab') as f:
+            f.write(b'0' * 1024)
+            
+        with patch('time.monotonic', return_value=time.monotonic() + 61):
+            assert monitor.get_folder_size(self.temp_dir) == 2048
+            
+    def test_get_folder_size_cache_age_bounded_by_ttl_when_nested(self):
+        """Test that reusing older child entries does not extend their lifetime."""
+        monitor = FolderMonitor(cache_ttl=60)
+        deep_dir = os.path.join(self.temp_dir, 'a', 'b')
+        os.makedirs(deep_dir)
+        file_path = os.path.join(deep_dir, 'file.txt')
+        with open(file_path, 'wb') as f:
+            f.write(b'0' * 1024)
+            
+        def touch(path):
+            mtime_ns = os.stat(path).st_mtime_ns
+            os.utime(path, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+            
+        start = time.monotonic()
+        
+        def size_at(seconds):
+            with patch('time.monotonic', return_value=start + seconds):
+                return monitor.get_folder_size(self.temp_dir)
+                
+        assert size_at(0) == 1024
+        with open(file_path, 'ab') as f:
+            f.write(b'0' * 1024)
+        # Re-walk the upper levels, reusing the entry for 'b' cached at t=0
+        touch(self.temp_dir)
+        touch(os.path.join(self.temp_dir, 'a'))
+        assert size_at(50) == 1024
+        touch(self.temp_dir)
+        assert size_at(55) == 1024
+        
+        # Every entry still carries the t=0 data, so it all expires together
+        assert size_at(61) == 2048
+        
+    def test_get_folder_size_root_fast_path_respects_ttl(self):
+        """Test that the unchanged-root answer expires with the oldest data beneath it."""
+        monitor = FolderMonitor(cache_ttl=60)
+        deep_dir = os.path.join(self.temp_dir, 'a', 'b')
+        os.makedirs(deep_dir)
+        file_path = os.path.join(deep_dir, 'file.txt')
+        with open(file_path, 'wb') as f:
+            f.write(b'0' * 1024)
+            
+        start = time.monotonic()
+        
+        def size_at(seconds):
+            with patch('time.monotonic', return_value=start + seconds):
+                return monitor.get_folder_size(self.temp_dir)
+                
+        assert size_at(0) == 1024
+        with open(file_path, 'ab') as f:
+            f.write(b'0' * 1024)
+        # Re-walk the root at t=50, reusing the entry for 'a' cached at t=0
+        mtime_ns = os.stat(self.temp_dir).st_mtime_ns
+        os.utime(self.temp_dir, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+        assert size_at(50) == 1024
+        
+        with patch('os.scandir') as mock_scandir:
+            assert size_at(59) == 1024
+        mock_scandir.assert_not_called()
+        assert size_at(61) == 2048
+        
+    def test_get_folder_size_prunes_deleted_directories_from_cache(self):
+        """Test that cache entries for removed subdirectories do not accumulate."""
+        monitor = FolderMonitor(cache_ttl=60)
+        keep_dir = os.path.join(self.temp_dir, 'keep', 'inner')
+        os.makedirs(keep_dir)
+        
+        for i in range(3):
+            tmp_dir = os.path.join(self.temp_dir, f'tmp{i}')
+            os.makedirs(tmp_dir)
+            monitor.get_folder_size(self.temp_dir)
+            assert tmp_dir in monitor._size_cache
+            shutil.rmtree(tmp_dir)
+            
+        monitor.get_folder_size(self.temp_dir)
+        assert sorted(monitor._size_cache) == sorted([
+            self.temp_dir, os.path.dirname(keep_dir), keep_dir
+        ])
+        
+    def test_get_folder_size_prunes_only_the_removed_subtree(self):
+        """Test that removing a directory drops its cached descendants but not other folders'."""
+        monitor = FolderMonitor(cache_ttl=60)
+        nested_dir = os.path.join(self.temp_dir, 'gone', 'nested')
+        os.makedirs(nested_dir)
+        other_dir = tempfile.mkdtemp()
+        try:
+            os.makedirs(os.path.join(other_dir, 'sub'))
+            monitor.get_folder_size(other_dir)
+            monitor.get_folder_size(self.temp_dir)
+            assert nested_dir in monitor._size_cache
+            
+            shutil.rmtree(os.path.join(self.temp_dir, 'gone'))
+            monitor.get_folder_size(self.temp_dir)
+            
+            assert sorted(monitor._size_cache) == sorted([
+                self.temp_dir, other_dir, os.path.join(other_dir, 'sub')
+            ])
+            assert nested_dir not in monitor._subdirs
+        finally:
+            shutil.rmtree(other_dir)
+            
+    def test_get_folder_size_drops_expired_entries(self):
+        """Test that an expired cache entry is removed when it is read."""
+        monitor = FolderMonitor(cache_ttl=60)
+        self.create_test_file('file1.txt', 1024)
+        monitor.get_folder_size(self.temp_dir)
+        
+        with patch('time.monotonic', return_value=time.monotonic() + 61), \
+                patch('os.scandir', side_effect=PermissionError):
+            with pytest.raises(OSError):
+                monitor.get_folder_size(self.temp_dir)
+        assert self.temp_dir not in monitor._size_cache
+        
+    def test_get_folder_size_cache_disabled_by_default(self):
+        """Test that no subtree sizes are cached unless a TTL is configured."""
+        os.makedirs(os.path.join(self.temp_dir, 'subdir'))
+        self.monitor.get_folder_size(self.temp_dir)
+        assert self.monitor._size_cache == {}
+        
+    def test_remove_folder_from_monitor_invalidates_cache(self):
+        """Test that removing a folder drops its cached subtree sizes."""
+        monitor = FolderMonitor(cache_ttl=60)
+        os.makedirs(os.path.join(self.temp_dir, 'subdir'))
+        monitor.add_folder_to_monitor(self.temp_dir, 10)
+        monitor.get_folder_size(self.temp_dir)
+        assert monitor._size_cache
+        
+        monitor.remove_folder_from_monitor(self.temp_dir)
+        assert monitor._size_cache == {}
+        
+    def test_get_folder_size_stops_at_limit(self):
+        """Test that the walk stops once the running total exceeds the limit."""
+        subdir = os.path.join(self.temp_dir, 'subdir')
+        os.makedirs(subdir)
+        self.create_test_file('file1.txt', 2048)
+        with open(os.path.join(subdir, 'file2.txt'), 'wb') as f:
+            f.write(b'0' * 4096)
+            
+        # Files in the root are summed before any subdirectory is listed
+        assert self.monitor.get_folder_size(self.temp_dir, limit=1024) == 2048
+        assert self.monitor.get_folder_size(self.temp_dir, limit=8192) == 6144
+        assert self.monitor.get_folder_size(self.temp_dir) == 6144
+        
     def test_format_size_bytes(self):
         """Test formatting size in bytes."""
         assert self.monitor.format_size(512) == "512.00 B"
@@ -152,6 +535,23 @@ class TestFolderMonitor:
         """Test formatting size in gigabytes."""
         assert self.monitor.format_size(1610612736) == "1.50 GB"
         
+    def test_format_size_zero(self):
+        """Test formatting a zero size."""
+        assert self.monitor.format_size(0) == "0.00 B"
+        
+    def test_format_size_unit_boundaries(self):
+        """Test formatting sizes on either side of a unit boundary."""
+        assert self.monitor.format_size(1023) == "1023.00 B"
+        assert self.monitor.format_size(1024) == "1.00 KB"
+        assert self.monitor.format_size(1024 ** 2 - 1) == "1024.00 KB"
+        assert self.monitor.format_size(1024 ** 2) == "1.00 MB"
+        
+    def test_format_size_terabytes_and_petabytes(self):
+        """Test formatting sizes in terabytes and petabytes."""
+        assert self.monitor.format_size(3 * 1024 ** 4) == "3.00 TB"
+        assert self.monitor.format_size(2 * 1024 ** 5) == "2.00 PB"
+        assert self.monitor.format_size(2048 * 1024 ** 5) == "2048.00 PB"
+        
     def test_check_folder_limits_no_violations(self):
         """Test checking folder limits with no violations."""
         # Create small file
@@ -176,23 +576,85 @@ class TestFolderMonitor:
         assert len(violations) == 1
         
         violation = violations[0]
-        assert violation['folder_path'] == self.temp_dir
-        assert violation['current_size'] == large_file_size
-        assert violation['size_limit'] == 1024 * 1024
-        assert violation['excess_size'] == large_file_size - (1024 * 1024)
+        assert violation.folder_path == self.temp_dir
+        assert violation.current_size == large_file_size
+        assert violation.size_limit == 1024 * 1024
+        assert violation.excess_size == large_file_size - (1024 * 1024)
         
-    def test_trigger_alert(self):
-        """Test triggering an alert for a violation."""
-        violation = {
+    def test_check_folder_limits_reports_lower_bound(self):
+        """Test that a violation found early is flagged as a lower bound."""
+        subdir = os.path.join(self.temp_dir, 'subdir')
+        os.makedirs(subdir)
+        self.create_test_file('large.txt', 2 * 1024 * 1024)
+        with open(os.path.join(subdir, 'more.txt'), 'wb') as f:
+            f.write(b'0' * 1024 * 1024)
+        self.monitor.add_folder_to_monitor(self.temp_dir, 1)
+        
+        violations = self.monitor.check_folder_limits()
+        assert violations[0].current_size == 2 * 1024 * 1024
+        assert violations[0].current_size_at_least is True
+        
+        with patch('builtins.print') as mock_print:
+            self.monitor.trigger_alert(violations[0])
+        assert "Current Size: at least 2.00 MB" in mock_print.call_args[0][0]
+        
+        # The status view still reports the exact size
+        status = self.monitor.get_monitoring_status()
+        assert status['folders'][0]['current_size'] == 3 * 1024 * 1024
+        assert status['folders'][0]['current_size_at_least'] is False
+        
+    def test_check_folder_limits_exact_when_walk_completes(self):
+        """Test that a violation found by a complete walk is not a lower bound."""
+        sub_dir = os.path.join(self.temp_dir, 'sub')
+        os.makedirs(sub_dir)
+        self.create_test_file('file1.txt', 1024 * 1024)
+        with open(os.path.join(sub_dir, 'file2.txt'), 'wb') as f:
+            f.write(b'0' * 1024 * 1024)
+        self.monitor.add_folder_to_monitor(self.temp_dir, 1)
+        
+        violations = self.monitor.check_folder_limits()
+        assert violations[0].current_size == 2 * 1024 * 1024
+        assert violations[0].current_size_at_least is False
+        
+    def test_check_folder_limits_walks_each_folder_once(self):
+        """Test that each monitored folder is measured once per check."""
+        self.create_test_file('large.txt', 2 * 1024 * 1024)
+        self.monitor.add_folder_to_monitor(self.temp_dir, 1)
+        
+        with patch.object(self.monitor, '_walk_size',
+                          wraps=self.monitor._walk_size) as mock_size:
+            violations = self.monitor.check_folder_limits()
+            
+        assert len(violations) == 1
+        mock_size.assert_called_once_with(self.temp_dir, 1024 * 1024)
+        
+    def test_violation_formats_sizes_lazily(self):
+        """Test the derived and formatted fields of a violation."""
+        violation = Violation('/test/path', 2048, FolderLimit.from_bytes(1024))
+        
+        assert violation.excess_size == 1024
+        assert violation.to_dict() == {
             'folder_path': '/test/path',
             'current_size': 2048,
             'size_limit': 1024,
             'current_size_formatted': '2.00 KB',
             'size_limit_formatted': '1.00 KB',
             'excess_size': 1024,
-            'excess_size_formatted': '1.00 KB'
+            'excess_size_formatted': '1.00 KB',
+            'current_size_at_least': False
         }
         
+    def test_folder_status_to_dict_with_error(self):
+        """Test that a folder status with an error serializes only path and error."""
+        status = FolderStatus('/test/path', FolderLimit.from_bytes(1024), error='not found')
+        
+        assert status.is_over_limit is False
+        assert status.to_dict() == {'path': '/test/path', 'error': 'not found'}
+        
+    def test_trigger_alert(self):
+        """Test triggering an alert for a violation."""
+        violation = Violation('/test/path', 2048, FolderLimit.from_bytes(1024))
+        
         with patch('builtins.print') as mock_print:
             self.monitor.trigger_alert(violation)
             
@@ -200,6 +662,23 @@ class TestFolderMonitor:
         assert self.monitor.alerts_triggered[0]['violation'] == violation
         mock_print.assert_called()
         
+    def test_trigger_alert_message(self):
+        """Test the alert message built for a violation at a given time."""
+        violation = Violation('/test/path', 2048, FolderLimit.from_bytes(1024))
+        
+        with patch('builtins.print'):
+            self.monitor.trigger_alert(violation, '2024-01-01 12:00:00')
+            
+        assert self.monitor.alerts_triggered[0]['message'] == (
+            "🚨 FOLDER SIZE ALERT 🚨\n"
+            "Folder: /test/path\n"
+            "Current Size: 2.00 KB\n"
+            "Size Limit: 1.00 KB\n"
+            "Excess: 1.00 KB\n"
+            "Time: 2024-01-01 12:00:00\n"
+            + "-" * 50
+        )
+        
     def test_monitor_once_no_folders(self):
         """Test monitoring once with no configured folders."""
         with patch('builtins.print') as mock_print:
@@ -231,6 +710,53 @@ class TestFolderMonitor:
         assert result is True
         assert len(self.monitor.alerts_triggered) == 1
         
+    def test_check_folder_limits_parallel_matches_serial(self):
+        """Test that concurrent and serial folder walks report the same violations."""
+        folders = []
+        for i in range(4):
+            folder = os.path.join(self.temp_dir, f'folder{i}')
+            os.makedirs(folder)
+            with open(os.path.join(folder, 'data.bin'), 'wb') as f:
+                f.write(b'0' * (i * 1024 * 1024))
+            folders.append(folder)
+            
+        parallel_monitor = FolderMonitor({folder: 1024 * 1024 for folder in folders})
+        serial_monitor = FolderMonitor({folder: 1024 * 1024 for folder in folders},
+                                       parallel=False)
+        
+        parallel_violations = parallel_monitor.check_folder_limits()
+        serial_violations = serial_monitor.check_folder_limits()
+        
+        assert parallel_violations == serial_violations
+        assert [v.folder_path for v in parallel_violations] == folders[2:]
+        
+    def test_check_folder_limits_reports_errors_in_parallel(self):
+        """Test that a failing folder does not hide results for the others."""
+        self.create_test_file('large.txt', 2 * 1024 * 1024)
+        monitor = FolderMonitor({'/nonexistent/path': 1024, self.temp_dir: 1024 * 1024})
+        
+        with patch('builtins.print') as mock_print:
+            violations = monitor.check_folder_limits()
+            
+        assert [v.folder_path for v in violations] == [self.temp_dir]
+        assert "/nonexistent/path" in mock_print.call_args[0][0]
+        
+    def test_monitor_once_prints_output_once(self):
+        """Test that all output of a check is written with a single print."""
+        large_file_size = 2 * 1024 * 1024  # 2 MB
+        self.create_test_file('large.txt', large_file_size)
+        self.monitor.add_folder_to_monitor(self.temp_dir, 1)  # 1 MB limit
+        self.monitor.monitoring_config['/nonexistent/path'] = FolderLimit.from_bytes(1024)
+        
+        with patch('builtins.print') as mock_print:
+            self.monitor.monitor_once()
+            
+        mock_print.assert_called_once()
+        output = mock_print.call_args[0][0]
+        assert output.startswith("Error checking folder '/nonexistent/path'")
+        assert "Found 1 folder size violation(s):" in output
+        assert output.endswith(self.monitor.alerts_triggered[0]['message'])
+        
     @patch('time.sleep')
     def test_monitor_continuously_keyboard_interrupt(self, mock_sleep):
         """Test continuous monitoring with keyboard interrupt."""
@@ -244,6 +770,61 @@ class TestFolderMonitor:
             
         mock_sleep.assert_called_once_with(1)
         
+    def test_monitor_once_async_no_folders(self):
+        """Test asynchronous monitoring with no configured folders."""
+        with patch('builtins.print') as mock_print:
+            result = asyncio.run(self.monitor.monitor_once_async())
+            
+        assert result is False
+        mock_print.assert_called_with("No folders configured for monitoring.")
+        
+    def test_monitor_once_async_with_violations(self):
+        """Test asynchronous monitoring with a folder over its limit."""
+        self.create_test_file('large.txt', 2 * 1024 * 1024)
+        other_dir = os.path.join(self.temp_dir, 'other')
+        os.makedirs(other_dir)
+        self.monitor.add_folder_to_monitor(self.temp_dir, 1)  # 1 MB limit
+        self.monitor.add_folder_to_monitor(other_dir, 1)
+        self.monitor.monitoring_config['/nonexistent/path'] = FolderLimit.from_bytes(1024)
+        
+        with patch('builtins.print'):
+            result = asyncio.run(self.monitor.monitor_once_async())
+            
+        assert result is True
+        assert len(self.monitor.alerts_triggered) == 1
+        assert self.monitor.alerts_triggered[0]['violation'].folder_path == self.temp_dir
+        
+    def test_monitor_once_async_serial_when_parallel_disabled(self):
+        """Test that asynchronous monitoring walks folders one at a time when not parallel."""
+        monitor = FolderMonitor(parallel=False)
+        other_dir = os.path.join(self.temp_dir, 'other')
+        os.makedirs(other_dir)
+        monitor.add_folder_to_monitor(self.temp_dir, 1)
+        monitor.add_folder_to_monitor(other_dir, 1)
+        
+        with patch('builtins.print'), \
+                patch('asyncio.gather') as mock_gather, \
+                patch.object(monitor, '_measure_folders',
+                             wraps=monitor._measure_folders) as mock_measure:
+            result = asyncio.run(monitor.monitor_once_async())
+            
+        assert result is False
+        mock_gather.assert_not_called()
+        mock_measure.assert_called_once()
+        
+    @patch('asyncio.sleep')
+    def test_monitor_continuously_async_cancelled(self, mock_sleep):
+        """Test asynchronous continuous monitoring stops when cancelled."""
+        self.monitor.add_folder_to_monitor(self.temp_dir, 10)
+        mock_sleep.side_effect = asyncio.CancelledError()
+        
+        with patch('builtins.print') as mock_print:
+            with pytest.raises(asyncio.CancelledError):
+                asyncio.run(self.monitor.monitor_continuously_async(1))
+                
+        mock_sleep.assert_called_once_with(1)
+        mock_print.assert_called_with("\nMonitoring stopped by user.")
+        
     def test_get_monitoring_status_empty(self):
         """Test getting monitoring status with no folders."""
         status = self.monitor.get_monitoring_status()
@@ -273,11 +854,35 @@ class TestFolderMonitor:
     def test_get_monitoring_status_with_error(self):
         """Test getting monitoring status with folder access error."""
         # Add non-existent folder to config directly
-        self.monitor.monitoring_config['/nonexistent/path'] = 1024
+        self.monitor.monitoring_config['/nonexistent/path'] = FolderLimit.from_bytes(1024)
         
         status = self.monitor.get_monitoring_status()
         
         assert status['total_folders_monitored'] == 1
         assert len(status['folders']) == 1
         assert 'error' in status['folders'][0]
-
+        
+    def test_get_monitoring_status_caches_errors(self):
+        """Test that a failing folder is not retried until the negative cache expires."""
+        self.monitor.monitoring_config['/nonexistent/path'] = FolderLimit.from_bytes(1024)
+        first_error = self.monitor.get_monitoring_status()['folders'][0]['error']
+        
+        with patch('os.scandir') as mock_scandir:
+            status = self.monitor.get_monitoring_status()
+        mock_scandir.assert_not_called()
+        assert status['folders'][0]['error'] == first_error
+        
+        with patch('time.monotonic', return_value=time.monotonic() + 31), \
+                patch('os.scandir', side_effect=FileNotFoundError) as mock_scandir:
+            self.monitor.get_monitoring_status()
+        mock_scandir.assert_called_once()
+        
+    def test_add_folder_to_monitor_clears_cached_error(self):
+        """Test that re-adding a folder retries it straight away."""
+        folder = os.path.join(self.temp_dir, 'later')
+        self.monitor.monitoring_config[folder] = FolderLimit.from_bytes(1024)
+        assert 'error' in self.monitor.get_monitoring_status()['folders'][0]
+        
+        os.makedirs(folder)
+        self.monitor.add_folder_to_monitor(folder, 10)
+        assert 'error' not in self.monitor.get_monitoring_status()['folders'][0]
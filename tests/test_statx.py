@@ -0,0 +1,79 @@
+"""
+Unit tests for the statx helper module.
+
+This module tests that statx_size agrees with os.lstat, does not follow
+symlinks, and falls back cleanly when statx is unavailable.
+"""
+
+import errno
+import os
+import stat
+import tempfile
+import shutil
+import pytest
+from unittest.mock import patch
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src import _statx
+
+
+class TestStatx:
+    """Test class for statx_size functionality."""
+    
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.temp_dir, 'file.txt')
+        with open(self.file_path, 'wb') as f:
+            f.write(b'0' * 1536)
+            
+    def teardown_method(self):
+        """Clean up test fixtures after each test method."""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+            
+    def test_statx_size_matches_lstat(self):
+        """Test that statx_size reports the same type and size as os.lstat."""
+        result = _statx.statx_size(self.file_path)
+        expected = os.lstat(self.file_path)
+        
+        assert result.st_size == expected.st_size == 1536
+        assert stat.S_ISREG(result.st_mode)
+        assert (result.st_dev, result.st_ino) == (expected.st_dev, expected.st_ino)
+        
+    @pytest.mark.skipif(not hasattr(os, 'link'), reason="hard links not supported")
+    def test_statx_size_reports_link_count(self):
+        """Test that statx_size reports the number of hard links."""
+        os.link(self.file_path, os.path.join(self.temp_dir, 'link.txt'))
+        
+        assert _statx.statx_size(self.file_path).st_nlink == 2
+        
+    @pytest.mark.skipif(not hasattr(os, 'symlink'), reason="symlinks not supported")
+    def test_statx_size_does_not_follow_symlinks(self):
+        """Test that statx_size describes the symlink itself."""
+        link_path = os.path.join(self.temp_dir, 'link.txt')
+        os.symlink(self.file_path, link_path)
+        
+        result = _statx.statx_size(link_path)
+        assert stat.S_ISLNK(result.st_mode)
+        assert result.st_size == os.lstat(link_path).st_size
+        
+    def test_statx_size_missing_file(self):
+        """Test that statx_size raises for a missing file."""
+        with pytest.raises(FileNotFoundError):
+            _statx.statx_size(os.path.join(self.temp_dir, 'missing.txt'))
+            
+    @pytest.mark.skipif(not _statx.is_available(), reason="statx not available")
+    def test_statx_size_falls_back_on_enosys(self):
+        """Test that statx_size falls back to os.lstat when the kernel lacks statx."""
+        def fake_statx(*args):
+            _statx.ctypes.set_errno(errno.ENOSYS)
+            return -1
+            
+        with patch.object(_statx, '_statx', fake_statx):
+            result = _statx.statx_size(self.file_path)
+            assert _statx._statx is None
+            
+        assert result.st_size == 1536